@@ -3,16 +3,27 @@
 from decimal import Decimal
 from pathlib import Path
 
+import numpy as np
+import os
 import pandas as pd
+import shutil
 import zipfile
 import requests
 
+# Polars is optional: when installed its CSV reader parses in parallel
+# across all cores, otherwise we stay on the pandas/pyarrow path
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
 from nautilus_trader.backtest.engine import BacktestEngine
 from nautilus_trader.config import BacktestEngineConfig, LoggingConfig
 from nautilus_trader.examples.strategies.ema_cross import EMACross, EMACrossConfig
 from nautilus_trader.model import Bar, BarType, Money, TraderId, Venue
 from nautilus_trader.model.enums import AccountType, OmsType
 from nautilus_trader.model.currencies import USD
+from nautilus_trader.persistence.catalog import ParquetDataCatalog
 from nautilus_trader.persistence.wranglers import BarDataWrangler
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 
@@ -20,8 +31,126 @@ from nautilus_trader.test_kit.providers import TestInstrumentProvider
 def download(url: str) -> None:
     filename = url.rsplit("/", maxsplit=1)[1]
 
-    with open(filename, "wb") as f:
-        f.write(requests.get(url).content)
+    # Stream the response into the file in 1 MiB chunks, so the whole ZIP
+    # is never buffered in memory and network receive overlaps disk write
+    with requests.get(url, stream=True) as r:
+        # Check the status before the output file is created, so an HTTP
+        # error does not leave a zero-byte file behind
+        r.raise_for_status()
+        # Undo any transport Content-Encoding, so the bytes written are
+        # the archive itself and not the compressed wire form
+        r.raw.decode_content = True
+        # Write to a temporary name and rename into place only once the
+        # body is fully received; a transfer dropped mid-download can then
+        # never satisfy the exists() check that skips re-downloading
+        part = filename + ".part"
+        with open(part, "wb") as f:
+            shutil.copyfileobj(r.raw, f, length=1 << 20)
+        os.replace(part, filename)
+
+
+# Exness timestamps are fixed-width "YYYY-MM-DD HH:MM:SS.fff"; naming the
+# exact format takes the fast C strptime path instead of the generic
+# ISO8601 state machine
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+
+def _tick_mid_series(df: pd.DataFrame) -> pd.Series:
+    # The readers parse timestamps themselves (either as the index or as a
+    # native datetime column), so no string column ever reaches this point
+    if isinstance(df.index, pd.DatetimeIndex):
+        ts = df.index
+    else:
+        ts = pd.DatetimeIndex(df["Timestamp"])
+
+    # MID price for OHLC, computed in float32 straight from the tick arrays:
+    # half the bytes moved compared to the float64 temporary pandas allocates
+    mid = np.add(df["Bid"].to_numpy(), df["Ask"].to_numpy(), dtype=np.float32)
+    mid *= 0.5
+    return pd.Series(mid, index=ts, name="Mid")
+
+
+def get_or_build_bars(bar_type, instrument, catalog) -> list[Bar]:
+    # Serve the bars from the Parquet catalog when they were already built
+    # on a previous run; reading Parquet is orders of magnitude faster than
+    # re-parsing the tick CSV and re-running the wrangler
+    bars = catalog.bars(bar_types=[str(bar_type)])
+    if bars:
+        return bars
+
+    # Step 3a: Download CSV file
+    # The monthly archive is immutable, so skip the download when it is
+    # already cached from a previous run
+    zip_path = Path("Exness_EURUSDc_2025_09.zip")
+    if not zip_path.exists():
+        download(
+            "https://ticks.ex2archive.com/ticks/EURUSDc/2025/09/Exness_EURUSDc_2025_09.zip"
+        )
+
+    # Step 4a: Load bar data from CSV file -> into pandas DataFrame
+    # Read the CSV member straight out of the ZIP, so the decompressed file
+    # is never written to (and read back from) disk
+    with zipfile.ZipFile(zip_path, "r") as zip_ref:
+        with zip_ref.open("Exness_EURUSDc_2025_09.csv") as csv_file:
+            # Only three of the CSV columns are ever used; skipping the rest
+            # (Exness tag, Symbol, ...) avoids parsing and allocating them
+            if pl is not None:
+                mid_series = _tick_mid_series(
+                    pl.read_csv(
+                        csv_file,
+                        columns=["Timestamp", "Bid", "Ask"],
+                        schema_overrides={"Bid": pl.Float32, "Ask": pl.Float32},
+                        try_parse_dates=True,
+                    ).to_pandas()
+                )
+            else:
+                # Stream the ticks in 1M-row chunks, reducing each chunk to
+                # its float32 mid series before the next one is read. The
+                # working set stays bounded no matter how many months of
+                # ticks the file holds. (Only the C engine supports
+                # chunksize, so the pyarrow reader cannot be used here.)
+                # Parsing timestamps inside read_csv (with cache_dates
+                # deduplicating repeats) means the intermediate object
+                # column of strings is never allocated
+                mid_series = pd.concat(
+                    _tick_mid_series(chunk)
+                    for chunk in pd.read_csv(
+                        csv_file,
+                        usecols=["Timestamp", "Bid", "Ask"],
+                        # float32 keeps full precision for 5-digit FX quotes
+                        # and halves the memory the tick arrays occupy
+                        dtype={"Bid": np.float32, "Ask": np.float32},
+                        parse_dates=["Timestamp"],
+                        date_format=TIMESTAMP_FORMAT,
+                        cache_dates=True,
+                        index_col="Timestamp",
+                        chunksize=1_000_000,
+                    )
+                )
+
+    # Step 4b: Resample the mid series into the structure `BarDataWrangler`
+    # expects: 'open'/'high'/'low'/'close'/'volume' columns, timestamp index
+
+    # Single fused aggregation pass over the index; bar volume is just the
+    # tick count, so the separate resample().size() traversal is gone
+    ohlc_df = (
+        mid_series
+        .resample("15min")
+        .agg(open="first", high="max", low="min", close="last", volume="count")
+    )
+
+    # Remove volume = 0 (no data tick in that periode)
+    # No further mutation happens on the filtered frame, so there is no
+    # need to duplicate it with .copy() just to silence SettingWithCopy
+    ohlc_df_clean = ohlc_df.loc[ohlc_df["volume"].to_numpy() > 0]
+
+    # Step 4d: `BarDataWrangler` converts each row object of type `Bar`
+    wrangler = BarDataWrangler(bar_type, instrument)
+    bars = wrangler.process(ohlc_df_clean)
+
+    # Cache the wrangled bars so subsequent runs skip the whole CSV path
+    catalog.write_data(bars)
+    return bars
 
 
 if __name__ == "__main__":
@@ -49,48 +178,17 @@ if __name__ == "__main__":
     )
     engine.add_instrument(EURUSD_INSTRUMENT)
 
-    # Step 3a: Download CSV file
-    download(
-        "https://ticks.ex2archive.com/ticks/EURUSDc/2025/09/Exness_EURUSDc_2025_09.zip"
-    )
-
-    with zipfile.ZipFile("Exness_EURUSDc_2025_09.zip", "r") as zip_ref:
-        zip_ref.extractall(Path(__file__).parent)
-
-    # Step 4a: Load bar data from CSV file -> into pandas DataFrame
-    csv_file_path = r"Exness_EURUSDc_2025_09.csv"
-    df = pd.read_csv(csv_file_path, sep=",", decimal=".", header=0, index_col=False)
-
-    # Step 4b: Restructure DataFrame into required structure, that can be bassed `BarDataWrangler`
-    #   -   5 columns: 'open', 'high', 'low', 'close', 'volume'
-    #   -   'timestamp' as index
-
-    # Convert string timestamps into datetime
-    df["Timestamp"] = pd.to_datetime(df["Timestamp"], format="ISO8601")
-    # Seet column `timestamp` as index
-    df = df.set_index("Timestamp")
-    # MID price for OHLC
-    df["Mid"] = (df["Bid"] + df["Ask"]) / 2
-
-    ohlc_df = (
-        df["Mid"]
-        .resample("15min")
-        .agg({"open": "first", "high": "max", "low": "min", "close": "last"})
-    )
-    # Add volume
-    ohlc_df["volume"] = df.resample("15min").size()
-
-    # Remove volume = 0 (no data tick in that periode)
-    ohlc_df_clean = ohlc_df[ohlc_df["volume"] > 0].copy()
-
     # Step 4c: Define type of loaded bars
     EURUSD_15MIN_BARTYPE = BarType.from_str(
         f"{EURUSD_INSTRUMENT.id}-15-MINUTE-MID-EXTERNAL",
     )
 
-    # Step 4d: `BarDataWrangler` converts each row object of type `Bar`
-    wrangler = BarDataWrangler(EURUSD_15MIN_BARTYPE, EURUSD_INSTRUMENT)
-    eurusdc_15min_bars_list: list[Bar] = wrangler.process(ohlc_df_clean)
+    # Step 4: Load bar data, built from the tick CSV on the first run and
+    # served from the local Parquet catalog afterwards
+    catalog = ParquetDataCatalog("catalog")
+    eurusdc_15min_bars_list: list[Bar] = get_or_build_bars(
+        EURUSD_15MIN_BARTYPE, EURUSD_INSTRUMENT, catalog
+    )
 
     # Step 4e: Add loaded data to the engine
     engine.add_data(eurusdc_15min_bars_list)
@@ -98,10 +196,12 @@ if __name__ == "__main__":
     # Step 5: Create strategy and add it to engine
     config = EMACrossConfig(
         instrument_id=EURUSD_INSTRUMENT.id,
-        bar_type=BarType.from_str(f"{EURUSD_INSTRUMENT.id}-15-MINUTE-MID-EXTERNAL"),
+        bar_type=EURUSD_15MIN_BARTYPE,
         fast_ema_period=10,
         slow_ema_period=20,
-        trade_size=Decimal(10_000),
+        # Plain int: the size is integral and Quantity converts it directly,
+        # without a Decimal round-trip
+        trade_size=10_000,
     )
 
     strategy = EMACross(config=config)